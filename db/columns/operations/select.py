@@ -71,7 +71,7 @@ def _get_columns_name_from_attnums(table_oid, attnums, engine, connection_to_use
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message="Did not recognize type")
         pg_attribute = Table("pg_attribute", MetaData(), autoload_with=engine)
-    sel = select(pg_attribute.c.attname).where(
+    sel = select(pg_attribute.c.attname, pg_attribute.c.attnum).where(
         and_(
             pg_attribute.c.attrelid == table_oid,
             pg_attribute.c.attnum.in_(attnums)
@@ -80,13 +80,16 @@ def _get_columns_name_from_attnums(table_oid, attnums, engine, connection_to_use
     return sel
 
 
-def get_columns_name_from_attnums(table_oid, attnums, engine, connection_to_use=None):
+def get_columns_name_from_attnums(table_oid, attnums, engine, connection_to_use=None, return_as_attnum_map=False):
     """
     Returns the respective list of attnum of the column names passed.
      The order is based on the column order in the table and not by the order of the column names argument.
     """
     statement = _get_columns_name_from_attnums(table_oid, attnums, engine, connection_to_use=None)
     column_names_tuple = execute_statement(engine, statement, connection_to_use).fetchall()
+    if return_as_attnum_map:
+        attnum_name_map = {column_name_tuple[1]: column_name_tuple[0] for column_name_tuple in column_names_tuple}
+        return attnum_name_map
     column_names = [column_name_tuple[0] for column_name_tuple in column_names_tuple]
     return column_names
 
@@ -3,8 +3,9 @@ import warnings
 from sqlalchemy import MetaData, Table, select, and_
 
 
-def get_constraints_with_oids(engine, table_oid=None):
-    metadata = MetaData()
+def get_constraints_with_oids(engine, table_oid=None, metadata=None):
+    if metadata is None:
+        metadata = MetaData()
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message="Did not recognize type")
         pg_constraint = Table("pg_constraint", metadata, autoload_with=engine)
@@ -21,8 +22,9 @@ def get_constraints_with_oids(engine, table_oid=None):
     return result
 
 
-def get_constraint_from_oid(oid, engine, table):
-    metadata = MetaData()
+def get_constraint_from_oid(oid, engine, table, metadata=None):
+    if metadata is None:
+        metadata = MetaData()
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message="Did not recognize type")
         pg_constraint = Table("pg_constraint", metadata, autoload_with=engine)
@@ -36,6 +38,19 @@ def get_constraint_from_oid(oid, engine, table):
     return None
 
 
+def get_constraints_from_table_oid(table_oid, engine, table, metadata=None):
+    """
+    Returns a dict mapping the oids of the constraints of the table to the respective
+    constraints of the given SA table.
+    """
+    constraint_records = get_constraints_with_oids(engine, table_oid=table_oid, metadata=metadata)
+    constraints_by_name = {constraint.name: constraint for constraint in table.constraints}
+    return {
+        constraint_record['oid']: constraints_by_name.get(constraint_record['conname'])
+        for constraint_record in constraint_records
+    }
+
+
 def get_constraint_oid_by_name_and_table_oid(name, table_oid, engine):
     metadata = MetaData()
     with warnings.catch_warnings():
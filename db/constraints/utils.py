@@ -3,7 +3,7 @@ from enum import Enum
 from sqlalchemy import CheckConstraint, ForeignKeyConstraint, PrimaryKeyConstraint, UniqueConstraint
 from sqlalchemy.dialects.postgresql import ExcludeConstraint
 
-from db.columns.operations.select import get_column_name_from_attnum
+from db.columns.operations.select import get_column_name_from_attnum, get_columns_name_from_attnums
 from db.tables.operations.select import reflect_table_from_oid
 
 
@@ -57,6 +57,10 @@ def get_constraint_type_from_char(constraint_char):
 def get_constraint_name(engine, constraint_type, table_oid, column_0_attnum, connection_to_use=None):
     table_name = reflect_table_from_oid(table_oid, engine, connection_to_use).name
     column_0_name = get_column_name_from_attnum(table_oid, column_0_attnum, engine, connection_to_use)
+    return _get_conventional_constraint_name(constraint_type, table_name, column_0_name)
+
+
+def _get_conventional_constraint_name(constraint_type, table_name, column_0_name):
     data = {
         'table_name': table_name,
         'column_0_name': column_0_name
@@ -70,3 +74,36 @@ def get_constraint_name(engine, constraint_type, table_oid, column_0_attnum, con
     if constraint_type == ConstraintType.CHECK.value:
         return naming_convention['ck'] % data
     return None
+
+
+def append_constraint_to_table(table, constraint_obj, engine):
+    """
+    Attaches a constraint that was just created in the database to the reflected SA
+    table, so that the table doesn't need to be reflected again. Returns the name of
+    the constraint, or None if constraints of its type can't be attached.
+    """
+    constraint_type = constraint_obj.constraint_type()
+    if constraint_type not in [ConstraintType.UNIQUE.value, ConstraintType.FOREIGN_KEY.value]:
+        return None
+    # Column names are resolved the same way as when creating the constraint, which
+    # orders them as in the table.
+    columns_name = get_columns_name_from_attnums(constraint_obj.table_oid, constraint_obj.columns_attnum, engine)
+    name = constraint_obj.name or _get_conventional_constraint_name(constraint_type, table.name, columns_name[0])
+    if constraint_type == ConstraintType.UNIQUE.value:
+        sa_constraint = UniqueConstraint(*columns_name, name=name)
+    else:
+        # The referent table must be in the same MetaData for the foreign key to resolve
+        referent_table = reflect_table_from_oid(
+            constraint_obj.referent_table_oid, engine, metadata=table.metadata
+        )
+        referent_columns_name = get_columns_name_from_attnums(
+            constraint_obj.referent_table_oid, constraint_obj.referent_columns, engine
+        )
+        sa_constraint = ForeignKeyConstraint(
+            columns_name,
+            [referent_table.c[column_name] for column_name in referent_columns_name],
+            name=name,
+            **constraint_obj.options
+        )
+    table.append_constraint(sa_constraint)
+    return name
@@ -15,6 +15,13 @@ def get_schema_oid_from_name(name, engine):
         return schema_info["oid"]
 
 
+def get_all_schema_names(engine):
+    """
+    Returns a dict mapping the oids of the Mathesar schemas to their names.
+    """
+    return {oid: schema for schema, oid in get_mathesar_schemas_with_oids(engine)}
+
+
 def get_mathesar_schemas(engine):
     return [schema for schema, _ in get_mathesar_schemas_with_oids(engine)]
 
@@ -2,6 +2,7 @@ import warnings
 
 from sqlalchemy import Table, MetaData, select, join, inspect, and_
 
+from db.tables.utils import REFLECTED_TABLE_OIDS_KEY
 from db.utils import execute_statement
 
 
@@ -12,18 +13,33 @@ def reflect_table(name, schema, engine, metadata=None, connection_to_use=None):
     return Table(name, metadata, schema=schema, autoload_with=autoload_with, extend_existing=True)
 
 
-def reflect_table_from_oid(oid, engine, connection_to_use=None):
-    tables = reflect_tables_from_oids([oid], engine, connection_to_use)
+def reflect_table_from_oid(oid, engine, connection_to_use=None, metadata=None):
+    tables = reflect_tables_from_oids([oid], engine, connection_to_use, metadata=metadata)
     return tables.get(oid, None)
 
 
-def reflect_tables_from_oids(oids, engine, connection_to_use=None):
-    metadata = MetaData()
+def reflect_tables_from_oids(oids, engine, connection_to_use=None, metadata=None):
+    """
+    If a metadata is passed, the tables are reflected into it, and tables that were
+    previously reflected into it are returned without querying the database again.
+    """
+    tables = {}
+    if metadata is not None:
+        oid_table_keys = metadata.info.setdefault(REFLECTED_TABLE_OIDS_KEY, {})
+        tables = {
+            oid: metadata.tables[oid_table_keys[oid]]
+            for oid in oids
+            if oid_table_keys.get(oid) in metadata.tables
+        }
+        oids = [oid for oid in oids if oid not in tables]
+        if not oids:
+            return tables
+    catalog_metadata = MetaData() if metadata is None else metadata
 
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message="Did not recognize type")
-        pg_class = Table("pg_class", metadata, autoload_with=engine)
-        pg_namespace = Table("pg_namespace", metadata, autoload_with=engine)
+        pg_class = Table("pg_class", catalog_metadata, autoload_with=engine)
+        pg_namespace = Table("pg_namespace", catalog_metadata, autoload_with=engine)
     sel = (
         select(pg_namespace.c.nspname, pg_class.c.relname, pg_class.c.oid)
         .select_from(
@@ -36,9 +52,22 @@ def reflect_tables_from_oids(oids, engine, connection_to_use=None):
         .where(pg_class.c.oid.in_(oids))
     )
     results = execute_statement(engine, sel, connection_to_use).fetchall()
-    tables = {}
     for (schema, table_name, table_oid) in results:
-        tables[table_oid] = reflect_table(table_name, schema, engine, connection_to_use=connection_to_use)
+        if metadata is not None:
+            # A table with the same key might be a stale copy, e.g. one reflected
+            # through a foreign key before being altered.
+            stale_table = metadata.tables.get(f'{schema}.{table_name}')
+            if stale_table is not None:
+                metadata.remove(stale_table)
+        table = reflect_table(
+            table_name, schema, engine, metadata=metadata, connection_to_use=connection_to_use
+        )
+        if metadata is not None:
+            for stale_oid, table_key in list(oid_table_keys.items()):
+                if table_key == table.key:
+                    del oid_table_keys[stale_oid]
+            oid_table_keys[table_oid] = table.key
+        tables[table_oid] = table
     return tables
 
 
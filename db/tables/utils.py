@@ -1,6 +1,10 @@
 from sqlalchemy import Table, MetaData
 from sqlalchemy.inspection import inspect
 
+# Key of the MetaData.info entry mapping the oids of tables reflected into a shared
+# MetaData to their keys in MetaData.tables
+REFLECTED_TABLE_OIDS_KEY = 'reflected_table_oids'
+
 
 def get_empty_table(name):
     return Table(name, MetaData())
@@ -11,3 +15,41 @@ def get_primary_key_column(table):
     # We do not support getting by composite primary keys
     assert len(primary_key_list) == 1
     return primary_key_list[0]
+
+
+def remove_table_from_metadata(oid, metadata):
+    """
+    Removes the table with the given oid from a shared MetaData, along with any table
+    holding a foreign key to it, so that they are reflected afresh on next access.
+    """
+    oid_table_keys = metadata.info.get(REFLECTED_TABLE_OIDS_KEY, {})
+    table = metadata.tables.get(oid_table_keys.get(oid))
+    if table is None:
+        return
+    stale_tables = [table] + [
+        other_table
+        for other_table in metadata.tables.values()
+        if other_table is not table
+        and any(
+            fk.target_fullname.startswith(f'{table.fullname}.')
+            for fk in other_table.foreign_keys
+        )
+    ]
+    for stale_table in stale_tables:
+        metadata.remove(stale_table)
+    stale_keys = {stale_table.key for stale_table in stale_tables}
+    for table_oid, table_key in list(oid_table_keys.items()):
+        if table_key in stale_keys:
+            del oid_table_keys[table_oid]
+
+
+def remove_schema_tables_from_metadata(schema_name, metadata):
+    """
+    Removes every table of the given schema from a shared MetaData, e.g. after the
+    schema is renamed or dropped.
+    """
+    oid_table_keys = metadata.info.get(REFLECTED_TABLE_OIDS_KEY, {})
+    for oid, table_key in list(oid_table_keys.items()):
+        table = metadata.tables.get(table_key)
+        if table is not None and table.schema == schema_name:
+            remove_table_from_metadata(oid, metadata)
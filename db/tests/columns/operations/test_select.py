@@ -6,7 +6,7 @@ from sqlalchemy import (
 from db.columns.exceptions import DynamicDefaultWarning
 from db.columns.operations.select import (
     get_column_attnum_from_name, get_column_default, _is_default_expr_dynamic,
-    get_column_name_from_attnum, get_columns_attnum_from_names,
+    get_column_name_from_attnum, get_columns_attnum_from_names, get_columns_name_from_attnums,
 )
 from db.tables.operations.select import get_oid_from_table
 from db.tests.columns.utils import column_test_dict, get_default
@@ -49,6 +49,26 @@ def test_get_attnum_from_names(engine_with_schema):
     assert get_column_name_from_attnum(table_oid, columns_attnum[1], engine) == one_name
 
 
+def test_get_names_from_attnums_as_attnum_map(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_name = "table_with_columns"
+    zero_name = "colzero"
+    one_name = "colone"
+    table = Table(
+        table_name,
+        MetaData(bind=engine, schema=schema),
+        Column(zero_name, Integer),
+        Column(one_name, String),
+    )
+    table.create()
+    table_oid = get_oid_from_table(table_name, schema, engine)
+    columns_attnum = get_columns_attnum_from_names(table_oid, [zero_name, one_name], engine)
+    attnum_name_map = get_columns_name_from_attnums(
+        table_oid, columns_attnum, engine, return_as_attnum_map=True
+    )
+    assert attnum_name_map == {columns_attnum[0]: zero_name, columns_attnum[1]: one_name}
+
+
 @pytest.mark.parametrize("filler", [True, False])
 @pytest.mark.parametrize("col_type", column_test_dict.keys())
 def test_get_column_default(engine_with_schema, filler, col_type):
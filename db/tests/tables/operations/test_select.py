@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, MetaData, String, Table
+
+from db.tables.operations.select import get_oid_from_table, reflect_table_from_oid
+from db.tables.utils import remove_schema_tables_from_metadata, remove_table_from_metadata
+
+
+def _create_table(engine, schema, table_name):
+    table = Table(
+        table_name,
+        MetaData(bind=engine, schema=schema),
+        Column("colzero", Integer),
+        Column("colone", String),
+    )
+    table.create()
+    return get_oid_from_table(table_name, schema, engine)
+
+
+def test_reflect_table_from_oid_reuses_metadata(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_oid = _create_table(engine, schema, "table_with_metadata")
+    metadata = MetaData()
+    table_one = reflect_table_from_oid(table_oid, engine, metadata=metadata)
+    table_two = reflect_table_from_oid(table_oid, engine, metadata=metadata)
+    assert table_one is table_two
+    assert table_one.metadata is metadata
+
+
+def test_remove_table_from_metadata(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_oid = _create_table(engine, schema, "table_with_metadata")
+    metadata = MetaData()
+    table_one = reflect_table_from_oid(table_oid, engine, metadata=metadata)
+    remove_table_from_metadata(table_oid, metadata)
+    assert table_one.key not in metadata.tables
+    table_two = reflect_table_from_oid(table_oid, engine, metadata=metadata)
+    assert table_one is not table_two
+    assert table_two.key in metadata.tables
+
+
+def test_remove_schema_tables_from_metadata(engine_with_schema):
+    engine, schema = engine_with_schema
+    table_oids = [
+        _create_table(engine, schema, table_name)
+        for table_name in ["table_one_with_metadata", "table_two_with_metadata"]
+    ]
+    metadata = MetaData()
+    tables = [reflect_table_from_oid(table_oid, engine, metadata=metadata) for table_oid in table_oids]
+    remove_schema_tables_from_metadata(schema, metadata)
+    assert all(table.key not in metadata.tables for table in tables)
@@ -19,6 +19,12 @@ class ConstraintViewSet(ListModelMixin, RetrieveModelMixin, CreateModelMixin, vi
     def get_queryset(self):
         return Constraint.objects.filter(table__id=self.kwargs['table_pk']).order_by('-created_at')
 
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is not None:
+            Constraint.bulk_load_columns(page)
+        return page
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context['table'] = get_table_or_404(self.kwargs['table_pk'])
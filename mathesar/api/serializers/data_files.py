@@ -17,6 +17,7 @@ class DataFileSerializer(MathesarErrorMessageMixin, serializers.ModelSerializer)
     header = serializers.BooleanField(default=True)
     paste = serializers.CharField(required=False, trim_whitespace=False)
     url = serializers.URLField(required=False)
+    created_from = serializers.SerializerMethodField()
 
     class Meta:
         model = DataFile
@@ -60,6 +61,10 @@ class DataFileSerializer(MathesarErrorMessageMixin, serializers.ModelSerializer)
                 )
         return data
 
+    def get_created_from(self, obj):
+        if obj.created_from is not None:
+            return DataFile.created_from_choices(obj.created_from).name.lower()
+
     def validate_url(self, url):
         try:
             response = requests.head(url, allow_redirects=True)
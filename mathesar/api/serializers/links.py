@@ -10,6 +10,7 @@ from mathesar.api.serializers.shared_serializers import (
     ReadWritePolymorphicSerializerMappingMixin,
 )
 from mathesar.models.base import Table
+from mathesar.utils.models import invalidate_metadata
 
 
 class OneToOneSerializer(MathesarErrorMessageMixin, serializers.Serializer):
@@ -32,6 +33,7 @@ class OneToOneSerializer(MathesarErrorMessageMixin, serializers.Serializer):
             validated_data.get('referent_table').oid,
             unique_link=self.is_link_unique()
         )
+        invalidate_metadata(reference_table.schema._sa_engine, reference_table.oid)
         return validated_data
 
 
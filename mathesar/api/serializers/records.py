@@ -5,7 +5,6 @@ from sqlalchemy.exc import IntegrityError
 
 import mathesar.api.exceptions.database_exceptions.exceptions as database_api_exceptions
 from mathesar.api.exceptions.mixins import MathesarErrorMessageMixin
-from mathesar.models.base import Column
 from mathesar.api.utils import follows_json_number_spec
 from mathesar.database.types import UIType
 
@@ -47,12 +46,15 @@ class RecordSerializer(MathesarErrorMessageMixin, serializers.BaseSerializer):
     def to_internal_value(self, data):
         columns_map = self.context['columns_map'].inverse
         data = {columns_map[int(column_id)]: value for column_id, value in data.items()}
+        column_info_by_name = {
+            column_info.name: column_info
+            for column_info in self.context['table'].get_column_info()
+        }
         # If the data type of the column is number then the value must be an integer
         # or a string which follows JSON number spec.
         # TODO consider moving below routine to a DRF validate function
         for column_name, value in data.items():
-            column = Column.objects.get(id=columns_map.inverse[column_name])
-            is_number = column.ui_type == UIType.NUMBER
+            is_number = column_info_by_name[column_name].ui_type == UIType.NUMBER
             value_is_string = type(value) is str
             if is_number and value_is_string and not follows_json_number_spec(value):
                 raise database_api_exceptions.MathesarAPIException(
@@ -184,11 +184,19 @@ def _safe_set_intersection(sets):
         return set()
 
 
-def get_ui_type_from_db_type(db_type_to_find):
+def _get_db_types_mapped_to_ui_types():
+    db_types_mapped_to_ui_types = {}
     for ui_type in UIType:
-        associated_db_types = ui_type.db_types
-        if db_type_to_find in associated_db_types:
-            return ui_type
+        for db_type in ui_type.db_types:
+            db_types_mapped_to_ui_types.setdefault(db_type, ui_type)
+    return db_types_mapped_to_ui_types
+
+
+_db_types_mapped_to_ui_types = _get_db_types_mapped_to_ui_types()
+
+
+def get_ui_type_from_db_type(db_type_to_find):
+    return _db_types_mapped_to_ui_types.get(db_type_to_find)
 
 
 def get_ui_type_from_id(ui_type_id):
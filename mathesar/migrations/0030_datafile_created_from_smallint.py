@@ -0,0 +1,40 @@
+# Generated by Django 3.1.14 on 2022-07-05 10:12
+
+from django.db import migrations, models
+
+CREATED_FROM_VALUES = {'file': '1', 'paste': '2', 'url': '3'}
+
+
+def forwards_func(apps, schema_editor):
+    DataFile = apps.get_model("mathesar", "DataFile")
+    for name, value in CREATED_FROM_VALUES.items():
+        DataFile.objects.filter(created_from__iexact=name).update(created_from=value)
+    DataFile.objects.exclude(created_from__in=CREATED_FROM_VALUES.values()).update(created_from=None)
+
+
+def reverse_func(apps, schema_editor):
+    DataFile = apps.get_model("mathesar", "DataFile")
+    for name, value in CREATED_FROM_VALUES.items():
+        DataFile.objects.filter(created_from=value).update(created_from=name)
+    DataFile.objects.filter(created_from__isnull=True).update(created_from='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mathesar', '0029_auto_20220629_1450'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='datafile',
+            name='created_from',
+            field=models.CharField(blank=True, max_length=128, null=True),
+        ),
+        migrations.RunPython(forwards_func, reverse_func),
+        migrations.AlterField(
+            model_name='datafile',
+            name='created_from',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'File'), (2, 'Paste'), (3, 'Url')], null=True),
+        ),
+    ]
@@ -1,3 +1,7 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict, namedtuple
+
 from bidict import bidict
 
 from django.core.cache import cache
@@ -11,10 +15,14 @@ from db.columns import utils as column_utils
 from db.columns.operations.create import create_column, duplicate_column
 from db.columns.operations.alter import alter_column
 from db.columns.operations.drop import drop_column
-from db.columns.operations.select import get_column_name_from_attnum, get_columns_attnum_from_names
+from db.columns.operations.select import (
+    get_column_name_from_attnum, get_columns_attnum_from_names, get_columns_name_from_attnums,
+)
 from db.constraints.operations.create import create_constraint
 from db.constraints.operations.drop import drop_constraint
-from db.constraints.operations.select import get_constraint_oid_by_name_and_table_oid, get_constraint_from_oid
+from db.constraints.operations.select import (
+    get_constraint_oid_by_name_and_table_oid, get_constraints_from_table_oid,
+)
 from db.constraints import utils as constraint_utils
 from db.records.operations.delete import delete_record
 from db.records.operations.insert import insert_record_or_records
@@ -25,7 +33,7 @@ from db.schemas.operations.drop import drop_schema
 from db.schemas import utils as schema_utils
 from db.tables import utils as table_utils
 from db.tables.operations.drop import drop_table
-from db.tables.operations.select import get_oid_from_table, reflect_table_from_oid
+from db.tables.operations.select import reflect_table_from_oid
 from db.tables.operations.split import extract_columns_from_table
 
 from mathesar import reflection
@@ -35,6 +43,12 @@ from mathesar.database.types import UIType, get_ui_type_from_db_type
 
 
 NAME_CACHE_INTERVAL = 60 * 5
+ENGINE_READY_CHECK_INTERVAL = 5
+ENGINE_CACHE_SIZE = 32
+COLUMN_UPDATE_BATCH_SIZE = 100
+
+
+ColumnInfo = namedtuple('ColumnInfo', ['attnum', 'name', 'db_type', 'ui_type'])
 
 
 class BaseModel(models.Model):
@@ -47,10 +61,22 @@ class BaseModel(models.Model):
 
 class DatabaseObjectManager(models.Manager):
     def get_queryset(self):
+        # This only reflects once DB_REFLECTION_INTERVAL has passed since the last
+        # reflection. Lookups of objects belonging to an already fetched object should
+        # use current_objects, since reflection has just been checked for.
         reflection.reflect_db_objects()
         return super().get_queryset()
 
 
+class TableRelatedObjectManager(DatabaseObjectManager):
+    """
+    Used for objects belonging to a table, whose engine is reached through their table,
+    its schema and its database.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related('table__schema__database')
+
+
 class ReflectionManagerMixin(models.Model):
     """
     Used to reflect objects that exists on the user database but does not have a equivalent mathesar reference object.
@@ -86,7 +112,16 @@ class DatabaseObject(ReflectionManagerMixin, BaseModel):
 
 # TODO: Replace with a proper form of caching
 # See: https://github.com/centerofci/mathesar/issues/280
-_engines = {}
+# Maps database names to _CachedEngine instances, least recently used first
+_engines = OrderedDict()
+_engines_lock = threading.Lock()
+
+
+class _CachedEngine:
+    def __init__(self, engine):
+        self.engine = engine
+        self.last_checked = time.monotonic()
+        self.check_lock = threading.Lock()
 
 
 class Database(ReflectionManagerMixin, BaseModel):
@@ -97,16 +132,28 @@ class Database(ReflectionManagerMixin, BaseModel):
 
     @property
     def _sa_engine(self):
-        global _engines
-        # We're caching this since the engine is used frequently.
-        if self.name not in _engines:
-            engine = create_mathesar_engine(self.name)
-            _engines[self.name] = engine
-            return engine
-        else:
-            engine = _engines[self.name]
-            model_utils.ensure_cached_engine_ready(engine)
-            return engine
+        # We're caching this since the engine is used frequently. The lock makes sure
+        # concurrent requests don't create duplicate engines for the same database.
+        with _engines_lock:
+            if self.name in _engines:
+                cached_engine = _engines[self.name]
+                _engines.move_to_end(self.name)
+            else:
+                cached_engine = _CachedEngine(create_mathesar_engine(self.name))
+                _engines[self.name] = cached_engine
+                if len(_engines) > ENGINE_CACHE_SIZE:
+                    _, evicted_engine = _engines.popitem(last=False)
+                    evicted_engine.engine.dispose()
+        # Checking that the engine is usable costs a query, so we only do it once in a
+        # while, and skip it if another thread is already checking.
+        if time.monotonic() - cached_engine.last_checked >= ENGINE_READY_CHECK_INTERVAL:
+            if cached_engine.check_lock.acquire(blocking=False):
+                try:
+                    model_utils.ensure_cached_engine_ready(cached_engine.engine)
+                    cached_engine.last_checked = time.monotonic()
+                finally:
+                    cached_engine.check_lock.release()
+        return cached_engine.engine
 
     @property
     def supported_ui_types(self):
@@ -135,22 +182,19 @@ class Schema(DatabaseObject):
 
     @cached_property
     def name(self):
-        cache_key = f"{self.database.name}_schema_name_{self.oid}"
-        try:
-            schema_name = cache.get(cache_key)
-            if schema_name is None:
-                schema_name = schema_utils.get_schema_name_from_oid(
-                    self.oid, self._sa_engine
-                )
-                cache.set(cache_key, schema_name, NAME_CACHE_INTERVAL)
-            return schema_name
-        # We catch this error, since it lets us decouple the cadence of
-        # overall DB reflection from the cadence of cache expiration for
-        # schema names.  Also, it makes it obvious when the DB layer has
-        # been altered, as opposed to other reasons for a 404 when
-        # requesting a schema.
-        except TypeError:
-            return 'MISSING'
+        # The names of all schemas of a database are cached together, so that
+        # listing schemas takes a single cache lookup.
+        cache_key = f"{self.database.name}_schema_names"
+        schema_names = cache.get(cache_key)
+        if schema_names is None or self.oid not in schema_names:
+            # The schema might have been created since the names were cached.
+            schema_names = schema_utils.get_all_schema_names(self._sa_engine)
+            cache.set(cache_key, schema_names, NAME_CACHE_INTERVAL)
+        # Returning 'MISSING' lets us decouple the cadence of overall DB
+        # reflection from the cadence of cache expiration for schema names.
+        # Also, it makes it obvious when the DB layer has been altered, as
+        # opposed to other reasons for a 404 when requesting a schema.
+        return schema_names.get(self.oid, 'MISSING')
 
     # TODO: This should check for dependencies once the depdency endpoint is implemeted
     @property
@@ -161,10 +205,12 @@ class Schema(DatabaseObject):
         return model_utils.update_sa_schema(self, update_params)
 
     def delete_sa_schema(self):
-        return drop_schema(self.name, self._sa_engine, cascade=True)
+        result = drop_schema(self.name, self._sa_engine, cascade=True)
+        model_utils.invalidate_schema_metadata(self._sa_engine, self.name)
+        return result
 
     def clear_name_cache(self):
-        cache_key = f"{self.database.name}_schema_name_{self.oid}"
+        cache_key = f"{self.database.name}_schema_names"
         cache.delete(cache_key)
 
 
@@ -203,6 +249,7 @@ class Table(DatabaseObject):
         try:
             table = reflect_table_from_oid(
                 self.oid, self.schema._sa_engine,
+                metadata=model_utils.get_cached_metadata(self.schema._sa_engine),
             )
         # We catch these errors, since it lets us decouple the cadence of
         # overall DB reflection from the cadence of cache expiration for
@@ -211,8 +258,16 @@ class Table(DatabaseObject):
         # requesting a table.
         except (TypeError, IndexError):
             table = table_utils.get_empty_table("MISSING")
+        else:
+            model_utils.save_cached_metadata(self.schema._sa_engine)
         return table
 
+    @cached_property
+    def _sa_constraints_by_oid(self):
+        return get_constraints_from_table_oid(
+            self.oid, self._sa_engine, self._sa_table, model_utils.get_cached_metadata(self._sa_engine)
+        )
+
     @cached_property
     def _enriched_column_sa_table(self):
         return column_utils.get_enriched_column_table(
@@ -227,6 +282,30 @@ class Table(DatabaseObject):
     def sa_columns(self):
         return self._enriched_column_sa_table.columns
 
+    @cached_property
+    def sa_column_by_attnum(self):
+        name_attnum_map = get_columns_attnum_from_names(
+            self.oid, list(self.sa_column_names), self._sa_engine, return_as_name_map=True
+        )
+        return {
+            name_attnum_map[name]: sa_column
+            for name, sa_column in self.sa_columns.items()
+            if name in name_attnum_map
+        }
+
+    def get_column_info(self):
+        """
+        Returns a ColumnInfo for every column of the table, ordered by attnum, using a
+        single reflection of the table instead of going through Column objects.
+        """
+        column_info = []
+        for attnum, sa_column in sorted(self.sa_column_by_attnum.items()):
+            db_type = sa_column.db_type
+            column_info.append(
+                ColumnInfo(attnum, sa_column.name, db_type, get_ui_type_from_db_type(db_type))
+            )
+        return column_info
+
     @property
     def sa_constraints(self):
         return self._sa_table.constraints
@@ -241,19 +320,23 @@ class Table(DatabaseObject):
         return True
 
     def add_column(self, column_data):
-        return create_column(
+        column = create_column(
             self.schema._sa_engine,
             self.oid,
             column_data,
         )
+        model_utils.invalidate_metadata(self.schema._sa_engine, self.oid)
+        return column
 
     def alter_column(self, column_attnum, column_data):
-        return alter_column(
+        column = alter_column(
             self.schema._sa_engine,
             self.oid,
             column_attnum,
             column_data,
         )
+        model_utils.invalidate_metadata(self.schema._sa_engine, self.oid)
+        return column
 
     def drop_column(self, column_attnum):
         drop_column(
@@ -261,9 +344,10 @@ class Table(DatabaseObject):
             column_attnum,
             self.schema._sa_engine,
         )
+        model_utils.invalidate_metadata(self.schema._sa_engine, self.oid)
 
     def duplicate_column(self, column_attnum, copy_data, copy_constraints, name=None):
-        return duplicate_column(
+        column = duplicate_column(
             self.oid,
             column_attnum,
             self.schema._sa_engine,
@@ -271,6 +355,8 @@ class Table(DatabaseObject):
             copy_data=copy_data,
             copy_constraints=copy_constraints,
         )
+        model_utils.invalidate_metadata(self.schema._sa_engine, self.oid)
+        return column
 
     def get_preview(self, column_definitions):
         return get_column_cast_records(
@@ -288,7 +374,9 @@ class Table(DatabaseObject):
         return model_utils.update_sa_table(self, update_params)
 
     def delete_sa_table(self):
-        return drop_table(self.name, self.schema.name, self.schema._sa_engine, cascade=True)
+        result = drop_table(self.name, self.schema.name, self.schema._sa_engine, cascade=True)
+        model_utils.invalidate_metadata(self.schema._sa_engine, self.oid)
+        return result
 
     def get_record(self, id_value):
         return get_record(self._sa_table, self.schema._sa_engine, id_value)
@@ -323,38 +411,60 @@ class Table(DatabaseObject):
         return delete_record(self._sa_table, self.schema._sa_engine, id_value)
 
     def add_constraint(self, constraint_obj):
-        create_constraint(
-            self._sa_table.schema,
-            self.schema._sa_engine,
-            constraint_obj
-        )
-        try:
-            # Clearing cache so that new constraint shows up.
-            del self._sa_table
-        except AttributeError:
-            pass
-        engine = self.schema.database._sa_engine
-        name = constraint_obj.name
-        if not name:
-            name = constraint_utils.get_constraint_name(engine, constraint_obj.constraint_type(), self.oid, constraint_obj.columns_attnum[0])
+        engine = self._sa_engine
+        create_constraint(self._sa_table.schema, engine, constraint_obj)
+        # Clearing cache so that new constraint shows up.
+        self.__dict__.pop('_sa_constraints_by_oid', None)
+        name = None
+        metadata = model_utils.get_cached_metadata(engine)
+        if metadata is None or self._sa_table.metadata is metadata:
+            # Only a constraint was added, so we patch the reflected table in place
+            # rather than reflecting it again.
+            try:
+                name = constraint_utils.append_constraint_to_table(self._sa_table, constraint_obj, engine)
+            # The constraint is already created at this point, so if the table can't
+            # be patched, we invalidate it instead of failing.
+            except Exception:
+                name = None
+        if name is not None:
+            if metadata is not None:
+                model_utils.publish_metadata_change(engine)
+        else:
+            model_utils.invalidate_metadata(engine, self.oid)
+            self.__dict__.pop('_sa_table', None)
+            name = constraint_obj.name
+            if not name:
+                # Constraint columns are ordered as in the table, so the first one has the lowest attnum
+                name = constraint_utils.get_constraint_name(engine, constraint_obj.constraint_type(), self.oid, min(constraint_obj.columns_attnum))
         constraint_oid = get_constraint_oid_by_name_and_table_oid(name, self.oid, engine)
         return Constraint.current_objects.create(oid=constraint_oid, table=self)
 
     def get_column_name_id_bidirectional_map(self):
-        # TODO: Prefetch column names to avoid N+1 queries
-        columns = Column.objects.filter(table_id=self.id)
-        columns_map = bidict({column.name: column.id for column in columns})
+        attnum_id_pairs = Column.current_objects.filter(table_id=self.id).values_list('attnum', 'id')
+        attnum_name_map = get_columns_name_from_attnums(
+            self.oid,
+            [attnum for attnum, _ in attnum_id_pairs],
+            self._sa_engine,
+            return_as_attnum_map=True
+        )
+        columns_map = bidict({
+            attnum_name_map[attnum]: column_id
+            for attnum, column_id in attnum_id_pairs
+            if attnum in attnum_name_map
+        })
         return columns_map
 
     def get_columns_by_name(self, name_list):
-        columns_by_name_dict = {
-            col.name: col
+        columns_name_attnum_map = get_columns_attnum_from_names(
+            self.oid, name_list, self._sa_engine, return_as_name_map=True
+        )
+        columns_by_attnum_dict = {
+            col.attnum: col
             for col
-            in Column.objects.filter(table=self)
-            if col.name in name_list
+            in Column.current_objects.filter(table=self, attnum__in=columns_name_attnum_map.values())
         }
         return [
-            columns_by_name_dict[col_name]
+            columns_by_attnum_dict[columns_name_attnum_map[col_name]]
             for col_name
             in name_list
         ]
@@ -367,7 +477,7 @@ class Table(DatabaseObject):
             drop_original_table
     ):
         columns_name_to_extract = [column.name for column in columns_to_extract]
-        return extract_columns_from_table(
+        result = extract_columns_from_table(
             self.name,
             columns_name_to_extract,
             extracted_table_name,
@@ -376,6 +486,8 @@ class Table(DatabaseObject):
             self._sa_engine,
             drop_original_table=drop_original_table
         )
+        model_utils.invalidate_metadata(self._sa_engine, self.oid)
+        return result
 
     def update_column_reference(self, columns_name, column_name_id_map):
         columns_name_attnum_map = get_columns_attnum_from_names(
@@ -384,14 +496,23 @@ class Table(DatabaseObject):
             self._sa_engine,
             return_as_name_map=True
         )
+        columns_by_id = Column.current_objects.filter(
+            id__in=[column_name_id_map[column_name] for column_name in columns_name_attnum_map]
+        ).only('id').in_bulk()
         column_objs = []
         for column_name, column_attnum in columns_name_attnum_map.items():
-            column_id = column_name_id_map[column_name]
-            column = Column.current_objects.get(id=column_id)
+            column = columns_by_id[column_name_id_map[column_name]]
             column.table_id = self.id
             column.attnum = column_attnum
             column_objs.append(column)
-        Column.current_objects.bulk_update(column_objs, fields=['table_id', 'attnum'])
+        Column.current_objects.bulk_update(
+            column_objs, fields=['table_id', 'attnum'], batch_size=COLUMN_UPDATE_BATCH_SIZE
+        )
+        try:
+            # Clearing cache so that the moved columns show up under their new attnums.
+            del self.sa_column_by_attnum
+        except AttributeError:
+            pass
 
     def insert_records_to_existing_table(existing_table, temp_table, mappings):
         # TBD
@@ -400,17 +521,20 @@ class Table(DatabaseObject):
 
 class Column(ReflectionManagerMixin, BaseModel):
     table = models.ForeignKey('Table', on_delete=models.CASCADE, related_name='columns')
+    objects = TableRelatedObjectManager()
     attnum = models.IntegerField()
     display_options = JSONField(null=True, default=None)
 
     def __str__(self):
         return f"{self.__class__.__name__}: {self.table_id}-{self.attnum}"
 
-    def __getattribute__(self, name):
-        try:
-            return super().__getattribute__(name)
-        except AttributeError:
-            return getattr(self._sa_column, name)
+    def __getattr__(self, name):
+        # Only called when the regular attribute lookup fails, so model fields and
+        # properties don't pay for the fallback to the SA column.
+        if name == '_sa_column':
+            # Avoids infinite recursion if the SA column lookup itself fails.
+            raise AttributeError(name)
+        return getattr(self._sa_column, name)
 
     @property
     def _sa_engine(self):
@@ -419,9 +543,9 @@ class Column(ReflectionManagerMixin, BaseModel):
     # TODO probably shouldn't be private: a lot of code already references it.
     @cached_property
     def _sa_column(self):
-        return self.table.sa_columns[self.name]
+        return self.table.sa_column_by_attnum[self.attnum]
 
-    @property
+    @cached_property
     def name(self):
         return get_column_name_from_attnum(
             self.table.oid, self.attnum, self._sa_engine,
@@ -429,8 +553,7 @@ class Column(ReflectionManagerMixin, BaseModel):
 
     @property
     def ui_type(self):
-        if self.db_type:
-            return get_ui_type_from_db_type(self.db_type)
+        return get_ui_type_from_db_type(self.db_type)
 
     @property
     def db_type(self):
@@ -439,11 +562,13 @@ class Column(ReflectionManagerMixin, BaseModel):
 
 class Constraint(DatabaseObject):
     table = models.ForeignKey('Table', on_delete=models.CASCADE, related_name='constraints')
+    objects = TableRelatedObjectManager()
 
     @cached_property
     def _sa_constraint(self):
-        engine = self.table.schema.database._sa_engine
-        return get_constraint_from_oid(self.oid, engine, self.table._sa_table)
+        # The constraints of a table are fetched together, so that constraints sharing
+        # a table instance don't each query for their definition.
+        return self.table._sa_constraints_by_oid.get(self.oid)
 
     @property
     def name(self):
@@ -458,19 +583,60 @@ class Constraint(DatabaseObject):
         column_names = [column.name for column in self._sa_constraint.columns]
         engine = self.table.schema.database._sa_engine
         column_attnum_list = [result for result in get_columns_attnum_from_names(self.table.oid, column_names, engine)]
-        return Column.objects.filter(table=self.table, attnum__in=column_attnum_list).order_by("attnum")
+        return Column.current_objects.filter(table=self.table, attnum__in=column_attnum_list).order_by("attnum")
+
+    @classmethod
+    def bulk_load_columns(cls, constraints):
+        """
+        Populates the cached columns of the given constraints, resolving the column names
+        once per table and fetching all the columns in a single query.
+        """
+        constraints_by_table_id = defaultdict(list)
+        for constraint in constraints:
+            constraints_by_table_id[constraint.table_id].append(constraint)
+        constraints_attnums = []
+        for table_constraints in constraints_by_table_id.values():
+            # Sharing the table instance lets its reflected SA table be reused.
+            table = table_constraints[0].table
+            column_names = set()
+            for constraint in table_constraints:
+                constraint.table = table
+                column_names.update(column.name for column in constraint._sa_constraint.columns)
+            name_attnum_map = get_columns_attnum_from_names(
+                table.oid, list(column_names), table._sa_engine, return_as_name_map=True
+            )
+            for constraint in table_constraints:
+                attnums = sorted(
+                    name_attnum_map[column.name]
+                    for column in constraint._sa_constraint.columns
+                    if column.name in name_attnum_map
+                )
+                constraints_attnums.append((constraint, attnums))
+        all_attnums = {attnum for _, attnums in constraints_attnums for attnum in attnums}
+        columns_by_table_id_and_attnum = {
+            (column.table_id, column.attnum): column
+            for column in Column.current_objects.filter(
+                table_id__in=constraints_by_table_id.keys(), attnum__in=all_attnums
+            )
+        }
+        for constraint, attnums in constraints_attnums:
+            constraint.__dict__['columns'] = [
+                columns_by_table_id_and_attnum[(constraint.table_id, attnum)]
+                for attnum in attnums
+                if (constraint.table_id, attnum) in columns_by_table_id_and_attnum
+            ]
 
     @cached_property
     def referent_columns(self):
         if self.type == constraint_utils.ConstraintType.FOREIGN_KEY.value:
             column_names = [fk.column.name for fk in self._sa_constraint.elements]
             engine = self.table.schema._sa_engine
-            oid = get_oid_from_table(self._sa_constraint.referred_table.name,
-                                     self._sa_constraint.referred_table.schema,
-                                     engine)
+            oid = reflection.get_table_oid(self._sa_constraint.referred_table.name,
+                                           self._sa_constraint.referred_table.schema,
+                                           engine)
             table = Table.objects.get(oid=oid, schema=self.table.schema)
             column_attnum_list = get_columns_attnum_from_names(oid, column_names, table.schema._sa_engine)
-            columns = Column.objects.filter(table=table, attnum__in=column_attnum_list).order_by("attnum")
+            columns = Column.current_objects.filter(table=table, attnum__in=column_attnum_list).order_by("attnum")
             return columns
         return None
 
@@ -501,15 +667,18 @@ class Constraint(DatabaseObject):
             self.table.schema._sa_engine,
             self.name
         )
+        model_utils.invalidate_metadata(self.table.schema._sa_engine, self.table.oid)
         self.delete()
 
 
 class DataFile(BaseModel):
-    created_from_choices = models.TextChoices("created_from", "FILE PASTE URL")
+    created_from_choices = models.IntegerChoices("created_from", "FILE PASTE URL")
 
     file = models.FileField(upload_to=model_utils.user_directory_path)
     user = models.ForeignKey(User, blank=True, null=True, on_delete=models.CASCADE)
-    created_from = models.CharField(max_length=128, choices=created_from_choices.choices)
+    created_from = models.PositiveSmallIntegerField(
+        choices=created_from_choices.choices, blank=True, null=True
+    )
     table_imported_to = models.ForeignKey(Table, related_name="data_files", blank=True,
                                           null=True, on_delete=models.SET_NULL)
 
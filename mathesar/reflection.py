@@ -5,16 +5,24 @@ from django.db.models import Q
 from db.columns.operations.select import get_column_attnums_from_table
 from db.constraints.operations.select import get_constraints_with_oids
 from db.schemas.operations.select import get_mathesar_schemas_with_oids
-from db.tables.operations.select import get_table_oids_from_schema
+from db.tables.operations.select import get_oid_from_table, get_table_oids_from_schema
 # We import the entire models.base module to avoid a circular import error
 from mathesar.models import base as models
 from mathesar.api.serializers.shared_serializers import DisplayOptionsMappingSerializer, \
     DISPLAY_OPTIONS_SERIALIZER_MAPPING_KEY
 from mathesar.database.base import create_mathesar_engine
+from mathesar.utils import models as model_utils
 
 DB_REFLECTION_KEY = 'database_reflected_recently'
 DB_REFLECTION_INTERVAL = 60 * 5  # we reflect DB changes every 5 minutes
 
+# Maps (engine url, schema name, table name) tuples to the metadata version they were
+# looked up at and the table oid. Tables and schemas can only be dropped or renamed by
+# operations that bump the metadata version, so entries from older versions are
+# looked up again. Like the shared MetaData, this is only used when the cache is shared
+# between processes.
+_table_oids = {}
+
 
 # NOTE: All querysets used for reflection should use the .current_objects manager
 # instead of the .objects manger. The .objects manager calls reflect_db_objects when a
@@ -123,6 +131,7 @@ def reflect_new_table_constraints(table):
 
 def reflect_db_objects(skip_cache_check=False):
     if skip_cache_check or not cache.get(DB_REFLECTION_KEY):
+        model_utils.clear_metadata_cache()
         reflect_databases()
         for database in models.Database.current_objects.filter(deleted=False):
             reflect_schemas_from_database(database.name)
@@ -132,3 +141,15 @@ def reflect_db_objects(skip_cache_check=False):
             reflect_columns_from_table(table)
         reflect_constraints_from_database(database.name)
         cache.set(DB_REFLECTION_KEY, True, DB_REFLECTION_INTERVAL)
+
+
+def get_table_oid(name, schema, engine):
+    if not model_utils.is_cache_shared():
+        return get_oid_from_table(name, schema, engine)
+    key = (engine.url, schema, name)
+    version = model_utils.get_metadata_version()
+    cached_version, oid = _table_oids.get(key, (None, None))
+    if cached_version != version:
+        oid = get_oid_from_table(name, schema, engine)
+        _table_oids[key] = (version, oid)
+    return oid
@@ -19,7 +19,7 @@ def create_data_file():
     def _create_data_file(file_path, file_name):
         with open(file_path, 'rb') as csv_file:
             data_file = DataFile.objects.create(
-                file=File(csv_file), created_from='file',
+                file=File(csv_file), created_from=DataFile.created_from_choices.FILE,
                 base_name=file_name
             )
 
@@ -3,9 +3,10 @@ import json
 from sqlalchemy import Column as SAColumn, ForeignKey, Integer, MetaData, Table as SATable, select
 
 from db.columns.operations.select import get_column_attnum_from_name
-from db.constraints.base import UniqueConstraint
+from db.constraints import utils as constraint_utils
+from db.constraints.base import ForeignKeyConstraint, UniqueConstraint
 from db.tables.operations.select import get_oid_from_table
-from mathesar.models.base import Table, Column
+from mathesar.models.base import Column, Constraint, Table
 from mathesar.api.exceptions.error_codes import ErrorCodes
 
 
@@ -151,6 +152,27 @@ def test_multiple_column_constraint_list(create_patents_table, client):
             _verify_unique_constraint(constraint_data, constraint_column_id_list, 'NASA Constraint List 2_Center_key')
 
 
+def test_constraint_list_columns_match_unbatched_columns(create_patents_table, client):
+    tables = [create_patents_table(f'NASA Constraint List Batched {i}') for i in range(2)]
+    for table in tables:
+        constraint_columns = table.get_columns_by_name(['Case Number', 'Center'])
+        table.add_constraint(UniqueConstraint(None, table.oid, [column.attnum for column in constraint_columns]))
+
+    constraints = list(Constraint.current_objects.filter(table__in=tables))
+    Constraint.bulk_load_columns(constraints)
+    assert len(constraints) == 4
+    for constraint in constraints:
+        unbatched_constraint = Constraint.current_objects.get(id=constraint.id)
+        assert [column.id for column in constraint.columns] == [column.id for column in unbatched_constraint.columns]
+
+    for table in tables:
+        response = client.get(f'/api/db/v0/tables/{table.id}/constraints/')
+        assert response.status_code == 200
+        for constraint_data in response.json()['results']:
+            unbatched_constraint = Constraint.current_objects.get(id=constraint_data['id'])
+            assert constraint_data['columns'] == [column.id for column in unbatched_constraint.columns]
+
+
 def test_retrieve_constraint(create_patents_table, client):
     table_name = 'NASA Constraint List 3'
     table = create_patents_table(table_name)
@@ -220,6 +242,61 @@ def test_create_unique_constraint_with_name_specified(create_patents_table, clie
     _verify_unique_constraint(response.json(), constraint_column_id_list, 'awesome_constraint')
 
 
+def test_add_unique_constraint_patches_cached_table(create_patents_table):
+    table = create_patents_table('NASA Constraint List Patched')
+    sa_table = table._sa_table
+    constraint_columns = table.get_columns_by_name(['Center', 'Case Number'])
+    # The constraint columns are ordered as in the table, whatever order they're passed in
+    constraint = table.add_constraint(
+        UniqueConstraint(None, table.oid, [column.attnum for column in reversed(constraint_columns)])
+    )
+    assert table._sa_table is sa_table
+    sa_constraint = table._sa_constraints_by_oid[constraint.oid]
+    assert sa_constraint.name == 'NASA Constraint List Patched_Center_key'
+    assert [column.name for column in sa_constraint.columns] == ['Center', 'Case Number']
+    assert [column.id for column in constraint.columns] == [column.id for column in constraint_columns]
+
+
+def test_add_constraint_invalidates_table_when_patch_fails(create_patents_table, monkeypatch):
+    table = create_patents_table('NASA Constraint List Unpatched')
+    sa_table = table._sa_table
+
+    def _raise(*_):
+        raise KeyError
+
+    monkeypatch.setattr(constraint_utils, 'append_constraint_to_table', _raise)
+    constraint_columns = table.get_columns_by_name(['Center', 'Case Number'])
+    constraint = table.add_constraint(
+        UniqueConstraint(None, table.oid, [column.attnum for column in reversed(constraint_columns)])
+    )
+    assert table._sa_table is not sa_table
+    sa_constraint = table._sa_constraints_by_oid[constraint.oid]
+    assert sa_constraint.name == 'NASA Constraint List Unpatched_Center_key'
+    assert [column.name for column in sa_constraint.columns] == ['Center', 'Case Number']
+
+
+def test_add_foreign_key_constraint_patches_cached_table(two_foreign_key_tables):
+    referrer_table, referent_table = two_foreign_key_tables
+    referent_column = referent_table.get_columns_by_name(["Id"])[0]
+    referrer_column = referrer_table.get_columns_by_name(["Center"])[0]
+    referent_table.add_constraint(
+        UniqueConstraint(None, referent_table.oid, [referent_column.attnum])
+    )
+    sa_table = referrer_table._sa_table
+    constraint = referrer_table.add_constraint(
+        ForeignKeyConstraint(
+            None, referrer_table.oid, [referrer_column.attnum],
+            referent_table.oid, [referent_column.attnum], {}
+        )
+    )
+    assert referrer_table._sa_table is sa_table
+    sa_constraint = referrer_table._sa_constraints_by_oid[constraint.oid]
+    assert sa_constraint.name == referrer_table.name + '_Center_fkey'
+    assert sa_constraint.elements[0].column.table.name == referent_table.name
+    assert sa_constraint.elements[0].column.name == 'Id'
+    assert list(constraint.referent_columns) == [referent_column]
+
+
 def test_create_single_column_foreign_key_constraint(two_foreign_key_tables, client):
     referrer_table, referent_table = two_foreign_key_tables
     referent_column = referent_table.get_columns_by_name(["Id"])[0]
@@ -14,7 +14,11 @@ from mathesar.errors import InvalidTableError
 def verify_data_file_data(data_file, data_file_dict):
     assert data_file_dict['id'] == data_file.id
     assert data_file_dict['file'] == f'http://testserver/media/{data_file.file.name}'
-    assert data_file_dict['created_from'] == data_file.created_from
+    if data_file.created_from is not None:
+        created_from = DataFile.created_from_choices(data_file.created_from).name.lower()
+    else:
+        created_from = None
+    assert data_file_dict['created_from'] == created_from
     if data_file.table_imported_to:
         assert data_file_dict['table_imported_to'] == data_file.table_imported_to.id
     else:
@@ -75,7 +79,7 @@ def check_create_data_file_response(response, num_files, created_from, base_name
 
     assert response.status_code == 201
     assert DataFile.objects.count() == num_files + 1
-    assert data_file.created_from == created_from
+    assert data_file.created_from == DataFile.created_from_choices[created_from.upper()]
     assert data_file.base_name == base_name
     assert data_file.delimiter == delimiter
     assert data_file.quotechar == quotechar
@@ -29,7 +29,7 @@ def data_file(patents_csv_filepath):
     with open(patents_csv_filepath, 'rb') as csv_file:
         data_file = DataFile.objects.create(
             file=File(csv_file),
-            created_from='file',
+            created_from=DataFile.created_from_choices.FILE,
             base_name='patents'
         )
     return data_file
@@ -41,7 +41,7 @@ def paste_data_file(paste_filename):
         paste_text = paste_file.read()
     data_file = DataFile.objects.create(
         file=ContentFile(paste_text, name='paste_file.txt'),
-        created_from='paste',
+        created_from=DataFile.created_from_choices.PASTE,
         delimiter='\t',
         quotechar='',
         escapechar='',
@@ -55,7 +55,7 @@ def url_data_file(patents_url, patents_url_filename):
     with open(patents_url_filename, 'rb') as file:
         data_file = DataFile.objects.create(
             file=File(file),
-            created_from='url',
+            created_from=DataFile.created_from_choices.URL,
             base_name=base_name
         )
     return data_file
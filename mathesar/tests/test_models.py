@@ -1,9 +1,15 @@
 import pytest
-from unittest.mock import patch
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 from django.core.cache import cache
+from sqlalchemy import Column as SAColumn, Integer, Table as SATable, text
 
+from db.tables.utils import REFLECTED_TABLE_OIDS_KEY
 from mathesar import reflection
-from mathesar.models.base import Database, Schema, Table, schema_utils
+from mathesar.models import base as models_base
+from mathesar.models.base import Column, Database, Schema, Table, schema_utils
+from mathesar.utils import models as model_utils
 from mathesar.utils.models import attempt_dumb_query
 
 
@@ -12,12 +18,12 @@ def test_schema_name_sets_cache(monkeypatch, test_db_model):
         Schema, '_sa_engine', lambda x: None
     )
     monkeypatch.setattr(
-        schema_utils, 'get_schema_name_from_oid', lambda *_: 'myname'
+        schema_utils, 'get_all_schema_names', lambda *_: {123: 'myname'}
     )
     cache.clear()
     schema = Schema(oid=123, database=test_db_model)
     name = schema.name
-    assert cache.get(f"{schema.database.name}_schema_name_{schema.oid}") == name
+    assert cache.get(f"{schema.database.name}_schema_names") == {123: name}
 
 
 def test_schema_name_uses_cache(monkeypatch, test_db_model):
@@ -26,13 +32,13 @@ def test_schema_name_uses_cache(monkeypatch, test_db_model):
     )
     cache.clear()
     with patch.object(
-            schema_utils, 'get_schema_name_from_oid', return_value='myname'
-    ) as mock_get_name:
-        schema = Schema(oid=123, database=test_db_model)
-        name_one = schema.name
-        name_two = schema.name
-    assert name_one == name_two
-    assert mock_get_name.call_count == 1
+            schema_utils, 'get_all_schema_names', return_value={123: 'myname', 456: 'othername'}
+    ) as mock_get_names:
+        name_one = Schema(oid=123, database=test_db_model).name
+        name_two = Schema(oid=456, database=test_db_model).name
+    assert name_one == 'myname'
+    assert name_two == 'othername'
+    assert mock_get_names.call_count == 1
 
 
 def test_schema_name_handles_missing(monkeypatch, test_db_model):
@@ -40,11 +46,8 @@ def test_schema_name_handles_missing(monkeypatch, test_db_model):
         Schema, '_sa_engine', lambda _: None
     )
     cache.clear()
-
-    def mock_name_getter(*_):
-        raise TypeError
     monkeypatch.setattr(
-        schema_utils, 'get_schema_name_from_oid', mock_name_getter
+        schema_utils, 'get_all_schema_names', lambda *_: {}
     )
     schema = Schema(oid=123, database=test_db_model)
     name_ = schema.name
@@ -81,3 +84,177 @@ def test_database_engine_cache_stability(FUN_create_dj_db, iteration, uid):
     FUN_create_dj_db(some_db_name)
     db_model, _ = Database.objects.get_or_create(name=some_db_name)
     attempt_dumb_query(db_model._sa_engine)
+
+
+@pytest.fixture
+def mock_engine_cache(monkeypatch):
+    monkeypatch.setattr(models_base, '_engines', OrderedDict())
+    monkeypatch.setattr(models_base, 'create_mathesar_engine', lambda _: MagicMock())
+
+
+def test_database_engine_cache_reuses_engine(mock_engine_cache):
+    engine = Database(name='cached_db')._sa_engine
+    assert Database(name='cached_db')._sa_engine is engine
+
+
+def test_database_engine_cache_evicts_least_recently_used(mock_engine_cache, monkeypatch):
+    monkeypatch.setattr(models_base, 'ENGINE_CACHE_SIZE', 2)
+    engine_one = Database(name='db_one')._sa_engine
+    engine_two = Database(name='db_two')._sa_engine
+    # Using db_one again makes db_two the least recently used
+    assert Database(name='db_one')._sa_engine is engine_one
+    Database(name='db_three')._sa_engine
+    engine_two.dispose.assert_called_once()
+    engine_one.dispose.assert_not_called()
+    assert Database(name='db_two')._sa_engine is not engine_two
+
+
+def test_database_engine_ready_check_interval(mock_engine_cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(models_base, 'time', SimpleNamespace(monotonic=lambda: now[0]))
+    with patch.object(model_utils, 'ensure_cached_engine_ready') as mock_ensure_ready:
+        database = Database(name='checked_db')
+        database._sa_engine
+        now[0] += models_base.ENGINE_READY_CHECK_INTERVAL - 1
+        database._sa_engine
+        mock_ensure_ready.assert_not_called()
+        now[0] += 1
+        engine = database._sa_engine
+        mock_ensure_ready.assert_called_once_with(engine)
+        # The check restarts the interval
+        database._sa_engine
+        mock_ensure_ready.assert_called_once()
+
+
+def test_table_get_column_info(create_patents_table):
+    table = create_patents_table('Column Info Table')
+    column_info = table.get_column_info()
+    columns = sorted(Column.current_objects.filter(table=table), key=lambda column: column.attnum)
+    assert [info.attnum for info in column_info] == [column.attnum for column in columns]
+    for info, column in zip(column_info, columns):
+        assert info.name == column.name
+        assert info.db_type == column.db_type
+        assert info.ui_type == column.ui_type
+
+
+def test_table_update_column_reference_resolves_sa_column(create_patents_table):
+    table = create_patents_table('Column Reference Table')
+    column = table.get_columns_by_name(['Status'])[0]
+    old_attnum = column.attnum
+    assert table.sa_column_by_attnum[old_attnum].name == 'Status'
+    # Gives the "Status" name to a new column, with a new attnum
+    with table._sa_engine.begin() as conn:
+        conn.execute(text(
+            f'ALTER TABLE "{table._sa_table.schema}"."{table.name}" RENAME COLUMN "Status" TO "Old Status"'
+        ))
+        conn.execute(text(f'ALTER TABLE "{table._sa_table.schema}"."{table.name}" ADD COLUMN "Status" VARCHAR'))
+    table.update_column_reference(['Status'], {'Status': column.id})
+    column = Column.current_objects.get(id=column.id)
+    assert column.attnum != old_attnum
+    column.table = table
+    assert column._sa_column.name == 'Status'
+    assert column.name == 'Status'
+
+
+@pytest.fixture
+def empty_metadata_cache():
+    model_utils._metadata.by_engine_url.clear()
+    yield
+    model_utils._metadata.by_engine_url.clear()
+
+
+@pytest.fixture
+def shared_metadata_cache(monkeypatch, empty_metadata_cache):
+    monkeypatch.setattr(model_utils, 'is_cache_shared', lambda: True)
+
+
+def _add_metadata_table(metadata):
+    table = SATable('metadata_table', metadata, SAColumn('id', Integer), schema='metadata_schema')
+    metadata.info[REFLECTED_TABLE_OIDS_KEY] = {123: table.key}
+    return table
+
+
+def test_invalidate_metadata_bumps_version(shared_metadata_cache, test_db_model):
+    engine = test_db_model._sa_engine
+    metadata = model_utils.get_cached_metadata(engine)
+    version = model_utils.get_metadata_version()
+    model_utils.invalidate_metadata(engine, 123)
+    assert model_utils.get_metadata_version() == version + 1
+    assert model_utils.get_cached_metadata(engine) is metadata
+
+
+def test_invalidate_metadata_drops_metadata_altered_elsewhere(shared_metadata_cache, test_db_model):
+    engine = test_db_model._sa_engine
+    metadata = model_utils.get_cached_metadata(engine)
+    # Simulates another thread altering the database in the meantime
+    model_utils._bump_metadata_version()
+    model_utils.invalidate_metadata(engine, 123)
+    assert model_utils.get_cached_metadata(engine) is not metadata
+
+
+def test_clear_metadata_cache_replaces_metadata(shared_metadata_cache, test_db_model):
+    engine = test_db_model._sa_engine
+    metadata = model_utils.get_cached_metadata(engine)
+    version = model_utils.get_metadata_version()
+    model_utils.clear_metadata_cache()
+    assert model_utils.get_metadata_version() == version + 1
+    assert model_utils.get_cached_metadata(engine) is not metadata
+
+
+def test_cached_metadata_not_shared_with_local_cache(empty_metadata_cache, test_db_model):
+    engine = test_db_model._sa_engine
+    assert model_utils.get_cached_metadata(engine) is None
+    model_utils.save_cached_metadata(engine)
+    version = model_utils.get_metadata_version()
+    assert cache.get(model_utils._get_metadata_cache_key(engine, version)) is None
+
+
+def test_cached_metadata_save_load_round_trip(shared_metadata_cache, test_db_model):
+    engine = test_db_model._sa_engine
+    table = _add_metadata_table(model_utils.get_cached_metadata(engine))
+    model_utils.save_cached_metadata(engine)
+    # Simulates another process starting with an empty metadata cache
+    model_utils._metadata.by_engine_url.clear()
+    loaded_metadata = model_utils.get_cached_metadata(engine)
+    assert table.key in loaded_metadata.tables
+    assert loaded_metadata.tables[table.key] is not table
+    assert loaded_metadata.bind is engine
+    assert loaded_metadata.info[REFLECTED_TABLE_OIDS_KEY] == {123: table.key}
+
+
+def test_cached_metadata_not_loaded_after_version_bump(shared_metadata_cache, test_db_model):
+    engine = test_db_model._sa_engine
+    table = _add_metadata_table(model_utils.get_cached_metadata(engine))
+    model_utils.save_cached_metadata(engine)
+    model_utils._metadata.by_engine_url.clear()
+    model_utils.invalidate_metadata(engine, 123)
+    assert table.key not in model_utils.get_cached_metadata(engine).tables
+
+
+def test_cached_metadata_unpickle_fallback(shared_metadata_cache, test_db_model):
+    engine = test_db_model._sa_engine
+    version = model_utils.get_metadata_version()
+    cache.set(model_utils._get_metadata_cache_key(engine, version), b'not a pickle')
+    metadata = model_utils.get_cached_metadata(engine)
+    assert len(metadata.tables) == 0
+    assert metadata.bind is engine
+
+
+def test_get_table_oid_uses_cache_until_version_bump(shared_metadata_cache, test_db_model):
+    engine = test_db_model._sa_engine
+    reflection._table_oids.clear()
+    with patch.object(reflection, 'get_oid_from_table', return_value=123) as mock_get_oid:
+        assert reflection.get_table_oid('table', 'schema', engine) == 123
+        assert reflection.get_table_oid('table', 'schema', engine) == 123
+        assert mock_get_oid.call_count == 1
+        model_utils.invalidate_metadata(engine, 123)
+        assert reflection.get_table_oid('table', 'schema', engine) == 123
+        assert mock_get_oid.call_count == 2
+
+
+def test_get_table_oid_not_cached_with_local_cache(test_db_model):
+    engine = test_db_model._sa_engine
+    with patch.object(reflection, 'get_oid_from_table', return_value=123) as mock_get_oid:
+        reflection.get_table_oid('table', 'schema', engine)
+        reflection.get_table_oid('table', 'schema', engine)
+        assert mock_get_oid.call_count == 2
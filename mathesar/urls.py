@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework_nested import routers
 
@@ -5,7 +6,11 @@ from mathesar import views
 from mathesar.api.db import viewsets as db_viewsets
 from mathesar.api.ui import viewsets as ui_viewsets
 
-db_router = routers.DefaultRouter()
+# DefaultRouter adds a browsable API root view and format suffix routes, which we only
+# need while developing. They'd otherwise be resolved against on every request.
+Router = routers.DefaultRouter if settings.DEBUG else routers.SimpleRouter
+
+db_router = Router()
 db_router.register(r'tables', db_viewsets.TableViewSet, basename='table')
 db_router.register(r'queries', db_viewsets.QueryViewSet, basename='query')
 db_router.register(r'links', db_viewsets.LinkViewSet, basename='links')
@@ -18,7 +23,7 @@ db_table_router.register(r'records', db_viewsets.RecordViewSet, basename='table-
 db_table_router.register(r'columns', db_viewsets.ColumnViewSet, basename='table-column')
 db_table_router.register(r'constraints', db_viewsets.ConstraintViewSet, basename='table-constraint')
 
-ui_router = routers.DefaultRouter()
+ui_router = Router()
 ui_router.register(r'databases', ui_viewsets.DatabaseViewSet, basename='database')
 
 urlpatterns = [
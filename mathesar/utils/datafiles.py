@@ -35,15 +35,15 @@ def create_datafile(data):
     if 'paste' in data:
         name = str(int(time())) + '.tsv'
         raw_file = ContentFile(str.encode(data['paste']), name=name)
-        created_from = 'paste'
+        created_from = DataFile.created_from_choices.PASTE
         base_name = ''
     elif 'url' in data:
         raw_file = _download_datafile(data['url'])
-        created_from = 'url'
+        created_from = DataFile.created_from_choices.URL
         base_name = raw_file.name
     elif 'file' in data:
         raw_file = data['file']
-        created_from = 'file'
+        created_from = DataFile.created_from_choices.FILE
         base_name = raw_file.name
 
     if base_name:
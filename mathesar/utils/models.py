@@ -1,17 +1,49 @@
 import os
+import pickle
+import threading
+import time
 
-from sqlalchemy import text
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from sqlalchemy import MetaData, text
 from sqlalchemy.exc import OperationalError
 
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 
 from db.tables.operations.alter import alter_table, SUPPORTED_TABLE_ALTER_ARGS
+from db.tables.utils import (
+    REFLECTED_TABLE_OIDS_KEY, remove_schema_tables_from_metadata, remove_table_from_metadata
+)
 from db.schemas.operations.alter import alter_schema, SUPPORTED_SCHEMA_ALTER_ARGS
 
 from mathesar.api.exceptions.error_codes import ErrorCodes
 from mathesar.api.exceptions.generic_exceptions import base_exceptions as base_api_exceptions
-from mathesar.reflection import reflect_columns_from_table
+# We import the entire reflection module to avoid a circular import error
+from mathesar import reflection
+
+# Reflecting a table into a fresh MetaData issues ~10 queries, so we share a single
+# MetaData per database and invalidate the affected tables on mutating operations.
+# Every invalidation bumps a metadata version kept in the Django cache, so that other
+# threads and processes notice mutations. The MetaData is also pickled into the cache,
+# so that new processes can start warm. This needs a cache shared between processes,
+# since otherwise they can't notice each other's mutations, so tables are reflected
+# into a fresh MetaData when the cache is process local.
+METADATA_CACHE_INTERVAL = 60 * 60
+# Tables reflected since the MetaData was last pickled are shared at most this often
+METADATA_SAVE_INTERVAL = 60
+METADATA_VERSION_KEY = 'metadata_version'
+
+
+class _ThreadMetadata(threading.local):
+    # SQLAlchemy doesn't support mutating a MetaData concurrently, so every thread
+    # keeps its own MetaData per engine.
+    def __init__(self):
+        self.by_engine_url = {}
+
+
+_metadata = _ThreadMetadata()
 
 
 def user_directory_path(instance, filename):
@@ -33,7 +65,8 @@ def update_sa_table(table, validated_data):
     try:
         data = _update_id_to_attnum(table, validated_data)
         alter_table(table.name, table.oid, table.schema.name, table.schema._sa_engine, data)
-        reflect_columns_from_table(table)
+        invalidate_metadata(table.schema._sa_engine, table.oid)
+        reflection.reflect_columns_from_table(table)
     # TODO: Catch more specific exceptions
     except Exception as e:
         raise base_api_exceptions.MathesarAPIException(e, status_code=status.HTTP_400_BAD_REQUEST)
@@ -49,7 +82,9 @@ def update_sa_schema(schema, validated_data):
         raise base_api_exceptions.GenericAPIException(errors, status_code=status.HTTP_400_BAD_REQUEST)
     if errors:
         raise ValidationError(errors)
-    alter_schema(schema.name, schema._sa_engine, validated_data)
+    old_name = schema.name
+    alter_schema(old_name, schema._sa_engine, validated_data)
+    invalidate_schema_metadata(schema._sa_engine, old_name)
 
 
 def ensure_cached_engine_ready(engine):
@@ -59,9 +94,9 @@ def ensure_cached_engine_ready(engine):
     query, which if it fails, will cause the engine to reestablish a usable connection and the
     subsequent queries will work as expected.
 
-    A problem with this is that we have to do this whenever an engine is retrieved from our engine
-    cache, which degrades the performance benefits of an engine cache. It might be worth eventually
-    benchmarking whether this is indeed better than not caching engines at all.
+    A problem with this is that it costs a query, which degrades the performance benefits of an
+    engine cache. To limit that, callers only check a cached engine once it hasn't been checked for
+    a while.
     """
     try:
         attempt_dumb_query(engine)
@@ -69,6 +104,142 @@ def ensure_cached_engine_ready(engine):
         pass
 
 
+class _CachedMetadata:
+    def __init__(self, metadata, version, saved_version=None):
+        self.metadata = metadata
+        self.version = version
+        self.saved_version = saved_version
+        self.saved_table_keys = set(metadata.tables)
+        self.saved_at = time.monotonic() if saved_version is not None else 0
+
+
+def is_cache_shared():
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (DummyCache, LocMemCache))
+
+
+def _get_metadata_cache_key(engine, version):
+    return f"metadata_{engine.url}_{version}"
+
+
+def _load_metadata(engine, version):
+    blob = cache.get(_get_metadata_cache_key(engine, version))
+    if blob is not None:
+        try:
+            metadata, reflected_table_oids = pickle.loads(blob)
+        except (pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+            pass
+        else:
+            # The bind and info of a MetaData are not pickled along with it
+            metadata.bind = engine
+            metadata.info[REFLECTED_TABLE_OIDS_KEY] = reflected_table_oids
+            return _CachedMetadata(metadata, version, saved_version=version)
+    return _CachedMetadata(MetaData(bind=engine), version)
+
+
+def _save_metadata(engine, cached_metadata):
+    metadata = cached_metadata.metadata
+    # We don't retry MetaData that can't be pickled until it changes
+    cached_metadata.saved_version = cached_metadata.version
+    cached_metadata.saved_table_keys = set(metadata.tables)
+    cached_metadata.saved_at = time.monotonic()
+    try:
+        blob = pickle.dumps((metadata, metadata.info.get(REFLECTED_TABLE_OIDS_KEY, {})))
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return
+    cache.set(_get_metadata_cache_key(engine, cached_metadata.version), blob, METADATA_CACHE_INTERVAL)
+
+
+def get_metadata_version():
+    return cache.get(METADATA_VERSION_KEY, 0)
+
+
+def get_cached_metadata(engine):
+    """
+    Returns the shared MetaData of the given engine, or None if the cache isn't shared
+    between processes.
+    """
+    if not is_cache_shared():
+        return None
+    version = get_metadata_version()
+    cached_metadata = _metadata.by_engine_url.get(engine.url)
+    if cached_metadata is None or cached_metadata.version != version:
+        cached_metadata = _load_metadata(engine, version)
+        _metadata.by_engine_url[engine.url] = cached_metadata
+    return cached_metadata.metadata
+
+
+def save_cached_metadata(engine):
+    """
+    Shares the MetaData of the given engine with other processes, if it changed since
+    it was last shared. Should be called after a table is reflected into it.
+    """
+    cached_metadata = _metadata.by_engine_url.get(engine.url)
+    if cached_metadata is None:
+        return
+    is_outdated = cached_metadata.saved_version != cached_metadata.version
+    has_new_tables = not set(cached_metadata.metadata.tables) <= cached_metadata.saved_table_keys
+    is_due = time.monotonic() - cached_metadata.saved_at >= METADATA_SAVE_INTERVAL
+    if is_outdated or (has_new_tables and is_due):
+        _save_metadata(engine, cached_metadata)
+
+
+def _bump_metadata_version():
+    try:
+        return cache.incr(METADATA_VERSION_KEY)
+    except ValueError:
+        cache.set(METADATA_VERSION_KEY, 1, None)
+        return 1
+
+
+def invalidate_metadata(engine, oid):
+    """
+    Should be called after any operation that alters the structure of the table with
+    the given oid, so that it is reflected afresh on next access.
+    """
+    cached_metadata = _metadata.by_engine_url.get(engine.url)
+    if cached_metadata is not None:
+        remove_table_from_metadata(oid, cached_metadata.metadata)
+    publish_metadata_change(engine)
+
+
+def invalidate_schema_metadata(engine, schema_name):
+    """
+    Should be called after a schema is renamed or dropped, so that its tables are
+    reflected afresh on next access.
+    """
+    cached_metadata = _metadata.by_engine_url.get(engine.url)
+    if cached_metadata is not None:
+        remove_schema_tables_from_metadata(schema_name, cached_metadata.metadata)
+    publish_metadata_change(engine)
+
+
+def clear_metadata_cache():
+    """
+    Makes every thread and process reflect all tables afresh, e.g. after the database
+    may have been altered outside of Mathesar.
+    """
+    _metadata.by_engine_url.clear()
+    _bump_metadata_version()
+
+
+def publish_metadata_change(engine):
+    """
+    Should be called after the shared MetaData of the given engine is altered, so that
+    other threads and processes pick up the change. The altered MetaData is shared
+    with them the next time a table is reflected into it.
+    """
+    version = _bump_metadata_version()
+    cached_metadata = _metadata.by_engine_url.get(engine.url)
+    if cached_metadata is None:
+        return
+    if version == cached_metadata.version + 1:
+        cached_metadata.version = version
+    else:
+        # Another thread or process altered the database since this MetaData was
+        # current, so it may hold tables that are stale.
+        del _metadata.by_engine_url[engine.url]
+
+
 def attempt_dumb_query(engine):
     with engine.connect() as con:
         con.execute(text('select 1 as is_alive'))
@@ -7,6 +7,7 @@ from mathesar.database.base import create_mathesar_engine
 from mathesar.imports.csv import create_table_from_csv
 from mathesar.models.base import Table
 from mathesar.reflection import reflect_columns_from_table
+from mathesar.utils.models import invalidate_metadata
 
 TABLE_NAME_TEMPLATE = 'Table'
 
@@ -16,6 +17,7 @@ POSTGRES_NAME_LEN_CAP = 63
 def get_table_column_types(table):
     schema = table.schema
     db_types = infer_table_column_types(schema.name, table.name, schema._sa_engine)
+    invalidate_metadata(schema._sa_engine, table.oid)
     col_types = {
         col.name: db_type.id
         for col, db_type in zip(table.sa_columns, db_types)